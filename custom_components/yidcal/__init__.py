@@ -30,7 +30,7 @@ from homeassistant.exceptions import ServiceValidationError
 import homeassistant.helpers.config_validation as cv
 from timezonefinder import TimezoneFinder
 
-from .const import DOMAIN
+from .const import DOMAIN, GEO_KEY, HELPER_KEY
 from .config_flow import (
     # General / existing
     CONF_INCLUDE_ATTR_SENSORS,
@@ -895,4 +895,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _zc.async_shutdown_timer()
         hass.data[DOMAIN].pop(COORDINATOR_KEY, None)
 
+    # Drop the shared YidCalHelper (and its molad memo) and the shared
+    # GeoLocation so a reload picks up a changed location / time zone.
+    hass.data.get(DOMAIN, {}).pop(HELPER_KEY, None)
+    hass.data.get(DOMAIN, {}).pop(GEO_KEY, None)
+
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -31,8 +31,11 @@ from hdate.translator import set_language
 set_language("he")
 
 from pyluach.hebrewcal import HebrewDate as PHebrewDate
-from .yidcal_lib.helper import YidCalHelper
-from .sensor import ShabbosMevorchimSensor, UpcomingShabbosMevorchimSensor
+from .sensor import (
+    ShabbosMevorchimSensor,
+    UpcomingShabbosMevorchimSensor,
+    shared_helper,
+)
 from .no_music_sensor import NoMusicSensor
 from .upcoming_yomtov_sensor import UpcomingYomTovSensor
 from .slichos_sensor import SlichosSensor 
@@ -948,7 +951,7 @@ async def async_setup_entry(
     cfg_conf = cfg_root.get("config", {}) or {}
     diaspora = cfg_conf.get("diaspora", True)
     
-    helper = YidCalHelper(hass.config)
+    helper = shared_helper(hass)
     helper._candle_offset   = candle
     helper._havdalah_offset = havdalah
     
@@ -1,6 +1,14 @@
 # Constants for the YidCal integration
 DOMAIN = "yidcal"
 
+# Key under hass.data[DOMAIN] for the single YidCalHelper shared by the
+# sensor and binary_sensor platforms (so its per-date molad memo is too).
+HELPER_KEY = "_yidcal_helper"
+
+# Key under hass.data[DOMAIN] for the ((lat, lon, tz), GeoLocation) pair
+# that zman_sensors.get_geo hands to every entity.
+GEO_KEY = "_yidcal_geo"
+
 # ─── Weekly luach feature flag ──────────────────────────────────────
 # The weekly-card luach style (one card per Sun→Shabbos week) ships
 # DISABLED in this release. To enable it: change False to True below,
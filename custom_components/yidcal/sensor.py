@@ -2,7 +2,9 @@
 from __future__ import annotations
 import logging
 import homeassistant.util.dt as dt_util
-from datetime import date, datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Any
 from zoneinfo import ZoneInfo
 from .device import YidCalDevice, YidCalDisplayDevice
 from zmanim.util.geo_location import GeoLocation
@@ -25,25 +27,21 @@ _JERUSALEM_GEO = GeoLocation(
     time_zone="Asia/Jerusalem",
     elevation=0,
 )
+_JERUSALEM_TZ = ZoneInfo("Asia/Jerusalem")
+# Motzei-Shabbos molad phrasing runs until 4 AM Sunday, Jerusalem time.
+_FOUR_AM = time(4, 0)
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import (
-    async_track_time_interval,
-    async_track_state_change_event,
-    async_track_sunset,
     async_track_time_change,
 )
 
-from hdate.converters import gdate_to_jdn
-from hdate.hebrew_date import HebrewDate as HHebrewDate
+from .yidcal_lib.calcache import hebrew_date as _hebrew_date
 
-import pyluach.dates as pdates
-from pyluach.hebrewcal import HebrewDate as PHebrewDate
-
-from .yidcal_lib.helper import YidCalHelper, MoladDetails
+from .yidcal_lib.helper import YidCalHelper, MoladDetails, hebrew_month_name
 from .yidcal_lib.sfirah_helper import SfirahHelper
 from .sfirah_sensor import SefirahCounter, SefirahCounterMiddos, SefirahCounterShort
 from .special_shabbos_sensor import SpecialShabbosSensor
@@ -105,7 +103,7 @@ from .zman_chumetz import (
     SofZmanAchilasChumetzSensor,
     SofZmanSriefesChumetzSensor,
 )
-from .const import DOMAIN
+from .const import DOMAIN, HELPER_KEY
 from .config_flow import (
     CONF_ENABLE_WEEKLY_YURTZEIT,
     CONF_ENABLE_YURTZEIT_DAILY,
@@ -122,32 +120,37 @@ from .config_flow import (
 _LOGGER = logging.getLogger(__name__)
 
 
-DAY_MAPPING = {
-    "Sunday": "זונטאג",
-    "Monday": "מאנטאג",
-    "Tuesday": "דינסטאג",
-    "Wednesday": "מיטוואך",
-    "Thursday": "דאנערשטאג",
-    "Friday": "פרייטאג",
-    "Shabbos": "שבת",
-}
-
-ENG2HEB = {
-    "Nisan":   "ניסן",
-    "Iyar":    "אייר",
-    "Sivan":   "סיון",
-    "Tammuz":  "תמוז",
-    "Av":      "אב",
-    "Elul":    "אלול",
-    "Tishrei": "תשרי",
-    "Cheshvan":"חשון",
-    "Kislev":  "כסלו",
-    "Teves":   "טבת",
-    "Shvat":   "שבט",
-    "Adar":    "אדר",     # when it’s a 12-month year
-    "Adar I":  "אדר א",   # leap year month 12
-    "Adar II": "אדר ב",   # leap year month 13
-}
+# Yiddish weekday names indexed by date.weekday() (Mon=0 … Sun=6).
+_DAY_BY_WEEKDAY = (
+    "מאנטאג", "דינסטאג", "מיטוואך", "דאנערשטאג", "פרייטאג", "שבת", "זונטאג",
+)
+
+def _shabbos_window(
+    geo: GeoLocation,
+    tz: ZoneInfo,
+    today: date,
+    candle_offset: int,
+    havdalah_offset: int,
+) -> tuple[datetime, datetime] | None:
+    """Rounded (candle-lighting, havdalah) of the Shabbos ``today`` belongs to.
+
+    Only Friday and Saturday belong to a Shabbos window; returns None on
+    other weekdays. Candle-lighting rounds half-up and havdalah rounds up,
+    matching the Erev/Motzi zman sensors.
+    """
+    wd = today.weekday()  # Mon=0 … Fri=4, Sat=5
+    if wd not in (4, 5):
+        return None
+    friday = today if wd == 4 else today - timedelta(days=1)
+    fri_sunset = sunset_for_date(geo=geo, tz=tz, base_date=friday)
+    sat_sunset = sunset_for_date(geo=geo, tz=tz, base_date=friday + timedelta(days=1))
+    return (
+        _round_half_up(fri_sunset - timedelta(minutes=candle_offset)),
+        _round_ceil(sat_sunset + timedelta(minutes=havdalah_offset)),
+    )
+
+# Morning labels by Jerusalem hour 0..11: before 6, 6-8, 9-11.
+_AM_TIME_OF_DAY = ("פארטאגס",) * 6 + ("אינדערפרי",) * 3 + ("פארמיטאג",) * 3
 
 def _molad_time_of_day_jerusalem(jer_dt: datetime, jer_tzeis: datetime) -> str:
     """
@@ -160,24 +163,35 @@ def _molad_time_of_day_jerusalem(jer_dt: datetime, jer_tzeis: datetime) -> str:
 
     # Morning side (Jerusalem)
     if hour < 12:
-        if hour < 6:
-            return "פארטאגס"
-        if hour < 9:
-            return "אינדערפרי"
-        return "פארמיטאג"
+        return _AM_TIME_OF_DAY[hour]
 
     # PM side (Jerusalem)
     if jer_dt < jer_tzeis:
         return "נאכמיטאג"
     return "ביינאכט"
 
+def shared_helper(hass: HomeAssistant) -> YidCalHelper:
+    """The one YidCalHelper for this setup, shared across platforms.
+
+    MoladSensor, RoshChodeshToday and the two Mevorchim binary sensors all
+    need the same molad details; sharing the helper shares its per-date
+    memo, so each date is computed once instead of once per sensor.
+    Dropped on unload (see __init__.async_unload_entry).
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    helper = data.get(HELPER_KEY)
+    if helper is None:
+        helper = data[HELPER_KEY] = YidCalHelper(hass.config)
+    return helper
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities,
 ) -> None:
     """Set up YidCal and related sensors with user-configurable offsets."""
-    yidcal_helper = YidCalHelper(hass.config)
+    yidcal_helper = shared_helper(hass)
 
     # Pull user-configured offsets/options
     opts = hass.data[DOMAIN][entry.entry_id]
@@ -395,9 +409,18 @@ class MoladSensor(YidCalDisplayDevice, SensorEntity):
         self._attr_native_value = None
         self._attr_extra_state_attributes: dict[str, any] = {}
         self._geo: GeoLocation | None = None
+        self._tz = ZoneInfo(hass.config.time_zone)
+        # molad instant -> (day_yd, tod_for_state, state, molad_part)
+        self._molad_text_cache: dict[datetime, tuple[str, str, str, str]] = {}
+        # (civil date, _compute_sync result) -- recomputed when the date changes
+        self._day: tuple[date, dict[str, Any]] | None = None
+        # [from, until) span over which the published output cannot change:
+        # the output only flips at the Shabbos window edges and at midnight,
+        # so the wall-clock tick skips everything in between.
+        self._valid: tuple[datetime, datetime] | None = None
 
     async def _handle_minute_tick(self, now):
-        """Called every minute by async_track_time_interval."""
+        """Called every minute (on :00) via _register_interval."""
         await self.async_update()
         
     async def async_added_to_hass(self) -> None:
@@ -417,67 +440,159 @@ class MoladSensor(YidCalDisplayDevice, SensorEntity):
         )
 
     async def async_update(self, now=None) -> None:
-        # 1) Use Home Assistant’s clock (aware)
-        tz = ZoneInfo(self.hass.config.time_zone)
-        now_local = (now or dt_util.now()).astimezone(tz)
+        # 1) Use Home Assistant’s clock (aware) -- one read, already in tz
+        tz = self._tz
+        now_local = now.astimezone(tz) if now else dt_util.now(tz)
+        if self._valid is not None and self._valid[0] <= now_local < self._valid[1]:
+            return
         today = now_local.date()
 
         # Shared geo (lazy fallback for very-early updates)
         if not self._geo:
             self._geo = await get_geo(self.hass)
 
-        jdn = gdate_to_jdn(today)
-        heb = HHebrewDate.from_jdn(jdn)
-
-        # Choose base_date exactly as before (ONLY for molad/RC context)
-        if heb.day < 3:
-            base_date = today - timedelta(days=15)
-        else:
-            base_date = today
-
-        try:
-            details: MoladDetails = self.helper.get_molad(base_date)
-        except Exception as e:
-            _LOGGER.error("Molad update failed: %s", e)
-            self._attr_native_value = None
-            return
+        # Everything below the Shabbos-window check depends only on the civil
+        # date; compute it in the executor once per day and reuse it on ticks.
+        if self._day is None or self._day[0] != today:
+            try:
+                day = await self.hass.async_add_executor_job(
+                    self._compute_sync, today
+                )
+            except Exception as e:
+                _LOGGER.error("Molad update failed: %s", e)
+                self._attr_native_value = None
+                self._valid = None
+                return
+            self._day = (today, day)
+        day = self._day[1]
 
         # ─── Shabbos Mevorchim: ON for the full Shabbos window (Fri candle → Sat havdalah) ───
-        # Identify this Shabbos' Friday/Saturday and the window edges, then ask helper
-        # if that Saturday is Mevorchim. Only then keep the flag ON for the whole window.
+        # The window edges and whether this Saturday is Mevorchim come from
+        # _compute_sync; only the comparison against "now" happens per tick.
         is_mev_window = False
         in_shabbos_window = False
-        wd = now_local.weekday()  # Mon=0 … Fri=4, Sat=5, Sun=6
-        if wd in (4, 5):  # Friday or Saturday
-            # Determine the Friday/Saturday pair for *this* Shabbos
-            friday = today if wd == 4 else (today - timedelta(days=1))
-            saturday = friday + timedelta(days=1)
-        
-            fri_sunset = sunset_for_date(geo=self._geo, tz=tz, base_date=friday)
-            sat_sunset = sunset_for_date(geo=self._geo, tz=tz, base_date=saturday)
-            shabbos_on  = fri_sunset - timedelta(minutes=self._candle_offset)
-            shabbos_off = sat_sunset + timedelta(minutes=self._havdalah_offset)
-        
+        day_end = datetime.combine(today + timedelta(days=1), time(0), tzinfo=tz)
+        until = day_end
+        window = day["shabbos_window"]
+        if window is not None:
+            shabbos_on, shabbos_off = window
             if shabbos_on <= now_local < shabbos_off:
                 in_shabbos_window = True
-                # Ask the helper about THIS Saturday (Gregorian) being Mevorchim
-                is_mevorchim_this_week = self.helper.is_shabbos_mevorchim(saturday)
-                is_mev_window = bool(is_mevorchim_this_week)
-        
+                is_mev_window = day["is_mevorchim_this_week"]
+            # Next possible flip: candle-lighting, havdalah, or the date roll
+            if now_local < shabbos_on:
+                until = shabbos_on
+            elif now_local < shabbos_off:
+                until = shabbos_off
+        self._valid = (now_local, min(until, day_end))
+
         # Forbid "upcoming" during the full Shabbos window; only compute it outside Shabbos
         if in_shabbos_window:
             is_upcoming_today = False
         else:
-            is_upcoming_today = self.helper.is_upcoming_shabbos_mevorchim(today)
+            is_upcoming_today = day["is_upcoming"]
+
+        self._attr_native_value = day["state"]
+        self._attr_extra_state_attributes = {
+            "Day": day["day_yd"],
+            "Hours": day["hours"],
+            "Minutes": day["minutes"],
+            "Time_Of_Day": day["tod_for_state"],
+            "Chalakim": day["chalakim"],
+            "Friendly": day["state"],
+            "Rosh_Chodesh": day["rc_text"],
+            "Rosh_Chodesh_Days": day["rc_days"],
+            # True for the ENTIRE Shabbos window only when it's a Mevorchim Shabbos
+            "Is_Shabbos_Mevorchim": is_mev_window,
+            "Is_Upcoming_Shabbos_Mevorchim": is_upcoming_today,
+            "Month_Name": day["month_name"],
+            "Full_Molad": day["full_molad"],
+        }
+
+    def _compute_sync(self, today: date) -> dict[str, Any]:
+        """Blocking hdate/pyluach/zmanim work for ``today``; runs in the executor."""
+        tz = self._tz
+        hd = _hebrew_date(today)
+
+        # Choose base_date exactly as before (ONLY for molad/RC context)
+        if hd.day < 3:
+            base_date = today - timedelta(days=15)
+        else:
+            base_date = today
+
+        details: MoladDetails = self.helper.get_molad(base_date)
+
+        # This Shabbos' window edges (Fri/Sat only), then ask helper if that
+        # Saturday is Mevorchim.
+        shabbos_window = _shabbos_window(
+            self._geo, tz, today, self._candle_offset, self._havdalah_offset
+        )
+        is_mevorchim_this_week = False
+        if shabbos_window is not None:
+            saturday = today + timedelta(days=5 - today.weekday())
+            # Ask the helper about THIS Saturday (Gregorian) being Mevorchim
+            is_mevorchim_this_week = bool(self.helper.is_shabbos_mevorchim(saturday))
 
         m = details.molad
+
+        # The molad wording depends only on the molad itself, so key it on
+        # m.dt: every base date in the same month reuses one entry.
+        cached = self._molad_text_cache.get(m.dt)
+        if cached is None:
+            cached = self._build_molad_text(m)
+            if len(self._molad_text_cache) >= 8:
+                self._molad_text_cache.clear()
+            self._molad_text_cache[m.dt] = cached
+        day_yd, tod_for_state, state, molad_part = cached
+
+        # 2) Rosh Chodesh attributes. Per-day nightfall/midnight lists are
+        # not exposed (RoshChodeshToday computes its own tzeis windows), so
+        # no sunset is looked up per RC day here.
+        rc = details.rosh_chodesh
+        rc_days = [_DAY_BY_WEEKDAY[g.weekday()] for g in rc.gdays]
+        rc_text = rc_days[0] if len(rc_days) == 1 else " & ".join(rc_days)
+
+        # 3) Compute the molad’s Hebrew month name using the same rollover rules as helper
+        if hd.day < 3:
+            target_year, target_month = hd.year, hd.month
+        else:
+            # Use helper’s next-month logic so we don’t mis-bump the year
+            nxt = self.helper.get_next_numeric_month_year(today)
+            target_year, target_month = nxt["year"], nxt["month"]
+
+        molad_month_name = hebrew_month_name(target_year, target_month)
+
+        # 4) Add Full_Molad attribute (molad_part shares the state's phrasing)
+        rc_text_yd = rc_days[0] if len(rc_days) == 1 else " און ".join(rc_days)
+        if rc_days:
+            full_molad = f"מולד חודש {molad_month_name} יהיה: {molad_part} - ראש חודש, {rc_text_yd}"
+        else:
+            full_molad = f"מולד חודש {molad_month_name} יהיה: {molad_part}"
+
+        return {
+            "shabbos_window": shabbos_window,
+            "is_mevorchim_this_week": is_mevorchim_this_week,
+            "is_upcoming": self.helper.is_upcoming_shabbos_mevorchim(today),
+            "state": state,
+            "day_yd": day_yd,
+            "hours": m.hours,
+            "minutes": m.minutes,
+            "tod_for_state": tod_for_state,
+            "chalakim": m.chalakim,
+            "rc_text": rc_text,
+            "rc_days": rc_days,
+            "month_name": molad_month_name,
+            "full_molad": full_molad,
+        }
+
+    def _build_molad_text(self, m) -> tuple[str, str, str, str]:
+        """Return (day_yd, tod_for_state, state, molad_part) for molad ``m``."""
         h, mi = m.hours, m.minutes
         chal = m.chalakim
-        chal_txt = "חלק" if chal == 1 else "חלקים"
 
         # Check if molad time is during motzei Shabbos (after havdalah) till Sunday 4am (Israel)
         is_special = False
-        jer_tz = ZoneInfo("Asia/Jerusalem")
+        jer_tz = _JERUSALEM_TZ
         jer_sunset = sunset_for_date(geo=_JERUSALEM_GEO, tz=jer_tz, base_date=m.date)
         jer_tzeis = jer_sunset + timedelta(minutes=self._havdalah_offset)
 
@@ -485,14 +600,11 @@ class MoladSensor(YidCalDisplayDevice, SensorEntity):
         tod_jer = _molad_time_of_day_jerusalem(m.dt, jer_tzeis)
 
         hav_end = jer_tzeis  # same boundary you were using, now named
-        if m.day == "Shabbos" and m.dt >= hav_end:
+        wd = m.dt.weekday()  # m.day is the name of this same weekday (Sat=5, Sun=6)
+        if wd == 5 and m.dt >= hav_end:
             is_special = True
-        elif m.day == "Sunday":
-            four_am = datetime(
-                m.date.year, m.date.month, m.date.day,
-                4, 0,
-                tzinfo=jer_tz
-            )
+        elif wd == 6:
+            four_am = datetime.combine(m.date, _FOUR_AM, tzinfo=jer_tz)
             if m.dt < four_am:
                 is_special = True
 
@@ -500,11 +612,10 @@ class MoladSensor(YidCalDisplayDevice, SensorEntity):
         # Jerusalem Friday after Jerusalem tzeis → "פרייטאג צונאכטס"
         friday_night = (
             not is_special
-            and m.dt.weekday() == 4        # Friday in Jerusalem
+            and wd == 4                    # Friday in Jerusalem
             and m.dt >= jer_tzeis          # after Jerusalem tzeis
         )
 
-        hh12 = h  # molad hour in Jerusalem
         if is_special:
             day_yd = 'מוצש"ק'
             tod_for_state = ""
@@ -512,76 +623,18 @@ class MoladSensor(YidCalDisplayDevice, SensorEntity):
             day_yd = "פרייטאג"
             tod_for_state = "צונאכטס"
         else:
-            day_yd = DAY_MAPPING.get(m.day, m.day)
+            day_yd = _DAY_BY_WEEKDAY[wd]
             tod_for_state = tod_jer
 
         chal_phrase = "" if chal == 0 else f" און {chal} {'חלק' if chal == 1 else 'חלקים'}"
 
-        if is_special:
-            state = f"מולד {day_yd}, {mi} מינוט{chal_phrase} נאך {hh12}"
-        else:
-            state = f"מולד {day_yd} {tod_for_state}, {mi} מינוט{chal_phrase} נאך {hh12}"
+        # Shared "<day> [time of day], <min> מינוט [chalakim] נאך <hour>" text;
+        # h is the molad hour in Jerusalem. Motzei Shabbos has no time of day.
+        when = day_yd if is_special else f"{day_yd} {tod_for_state}"
+        molad_part = f"{when}, {mi} מינוט{chal_phrase} נאך {h}"
+        state = f"מולד {molad_part}"
 
-        self._attr_native_value = state
-
-        # 2) Rosh Chodesh attributes (unchanged)
-        rc = details.rosh_chodesh
-        rc_mid = [f"{gd.isoformat()}T00:00:00Z" for gd in rc.gdays]
-
-        rc_night = []
-        for gd in rc.gdays:
-            prev = gd - timedelta(days=1)
-            prev_sunset = sunset_for_date(geo=self._geo, tz=tz, base_date=prev)
-            rc_night.append((prev_sunset + timedelta(minutes=self._havdalah_offset)).isoformat())
-
-        rc_days = [DAY_MAPPING.get(d, d) for d in rc.days]
-        rc_text = rc_days[0] if len(rc_days) == 1 else " & ".join(rc_days)
-
-        # 3) Compute the molad’s Hebrew month name using the same rollover rules as helper
-        hd = PHebrewDate.from_pydate(today)
-        if hd.day < 3:
-            target_year, target_month = hd.year, hd.month
-        else:
-            # Use helper’s next-month logic so we don’t mis-bump the year
-            nxt = self.helper.get_next_numeric_month_year(today)
-            target_year, target_month = nxt["year"], nxt["month"]
-
-        molad_month_name = PHebrewDate(target_year, target_month, 1).month_name(True)
-        
-        # 4) Add Full_Molad attribute (use the same Yiddish phrasing as state)
-        chal_phrase = "" if chal == 0 else f" און {chal} {'חלק' if chal == 1 else 'חלקים'}"
-
-        if is_special:
-            molad_part = f"מוצש\"ק, {mi} מינוט{chal_phrase} נאך {h}"
-        else:
-            molad_part = f"{day_yd} {tod_for_state}, {mi} מינוט{chal_phrase} נאך {h}"
-
-        rc_text_yd = rc_days[0] if len(rc_days) == 1 else " און ".join(rc_days)
-        if rc_days:
-            full_molad = f"מולד חודש {molad_month_name} יהיה: {molad_part} - ראש חודש, {rc_text_yd}"
-        else:
-            full_molad = f"מולד חודש {molad_month_name} יהיה: {molad_part}"
-
-        self._attr_extra_state_attributes = {
-            "Day": day_yd,
-            "Hours": h,
-            "Minutes": mi,
-            "Time_Of_Day": "" if is_special else tod_for_state,
-            "Chalakim": chal,
-            "Friendly": state,
-            # "Rosh_Chodesh_Midnight": rc_mid,
-            #"Rosh_Chodesh_Nightfall": rc_night,
-            "Rosh_Chodesh": rc_text,
-            "Rosh_Chodesh_Days": rc_days,
-            # True for the ENTIRE Shabbos window only when it's a Mevorchim Shabbos
-            "Is_Shabbos_Mevorchim": is_mev_window,
-            "Is_Upcoming_Shabbos_Mevorchim": is_upcoming_today,
-            "Month_Name": molad_month_name,
-            "Full_Molad": full_molad,
-        }
-
-    def update(self) -> None:
-        self.hass.async_create_task(self.async_update())
+        return day_yd, tod_for_state, state, molad_part
 
     @property
     def icon(self) -> str:
@@ -608,6 +661,10 @@ class DayLabelYiddishSensor(YidCalDevice, SensorEntity):
         self._state: str | None = None
         self._geo = None
         self._tz = ZoneInfo(self.hass.config.time_zone)
+        # (evaluated_at, valid_until): the label only changes at midnight,
+        # Friday noon, Friday candle-lighting and Saturday havdalah, so
+        # minute ticks before the next of those return immediately.
+        self._valid: tuple[datetime, datetime] | None = None
 
     @property
     def native_value(self) -> str | None:
@@ -617,8 +674,18 @@ class DayLabelYiddishSensor(YidCalDevice, SensorEntity):
         if not self._geo:
             return
 
-        current = (now or dt_util.now()).astimezone(self._tz)
+        current = now.astimezone(self._tz) if now else dt_util.now(self._tz)
+        if self._valid is not None and self._valid[0] <= current < self._valid[1]:
+            return
         today = current.date()
+        day_end = datetime.combine(today + timedelta(days=1), time(0), tzinfo=self._tz)
+
+        wd = current.weekday()  # Mon=0 … Fri=4, Sat=5, Sun=6
+        if wd not in (4, 5):
+            # Plain weekday name all day -- no sunset needed
+            self._state = _DAY_BY_WEEKDAY[wd]
+            self._valid = (current, day_end)
+            return
 
         sunset = sunset_for_date(geo=self._geo, tz=self._tz, base_date=today)
 
@@ -628,7 +695,6 @@ class DayLabelYiddishSensor(YidCalDevice, SensorEntity):
         candle   = _round_half_up(raw_candle)
         havdalah = _round_ceil(raw_havdalah)
 
-        wd = current.weekday()  # Mon=0 … Fri=4, Sat=5, Sun=6
         is_shab = (wd == 4 and current >= candle) or (wd == 5 and current < havdalah)
 
         if is_shab:
@@ -638,12 +704,19 @@ class DayLabelYiddishSensor(YidCalDevice, SensorEntity):
         elif wd == 5 and current >= havdalah:
             lbl = 'מוצש\"ק'
         else:
-            days = ["זונטאג", "מאנטאג", "דינסטאג", "מיטוואך", "דאנערשטאג", "פרייטאג", "שבת"]
-            idx = {6: 0, 0: 1, 1: 2, 2: 3, 3: 4, 4: 5, 5: 6}[wd]
-            lbl = days[idx]
+            lbl = _DAY_BY_WEEKDAY[wd]
 
         self._state = lbl
 
+        # Next possible flip today: Friday noon / candle-lighting, or
+        # Saturday havdalah; otherwise the date roll.
+        if wd == 4:
+            edges = (datetime.combine(today, time(12), tzinfo=self._tz), candle)
+        else:
+            edges = (havdalah,)
+        until = min((e for e in edges if e > current), default=day_end)
+        self._valid = (current, min(until, day_end))
+
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
@@ -688,6 +761,17 @@ class ShabbosMevorchimSensor(YidCalDevice, BinarySensorEntity):
         self._attr_is_on = False
         self._geo = None
         self._tz = ZoneInfo(self.hass.config.time_zone)
+        # (evaluated_at, valid_until): the state can't flip inside this span,
+        # so ticks landing in it skip the sun/helper work entirely. Kept on
+        # the wall-clock minute tick rather than a one-shot point-in-time
+        # timer so a stepped system clock still re-evaluates (see
+        # zmanim_coordinator.py).
+        self._valid: tuple[datetime, datetime] | None = None
+        # (saturday, on_time, off_time) of a Mevorchim Shabbos, or
+        # (saturday, None, None) when that Shabbos isn't Mevorchim -- the
+        # Fri/Sat re-evaluations at candle-lighting, havdalah and midnight
+        # all reuse it.
+        self._window: tuple[date, datetime | None, datetime | None] | None = None
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
@@ -696,26 +780,9 @@ class ShabbosMevorchimSensor(YidCalDevice, BinarySensorEntity):
 
         await self.async_update()
 
-        # registered for cleanup — bare calls leaked these across reloads
-        self._register_interval(
-            self.hass,
-            self.async_update,
-            timedelta(hours=1),
-        )
-
-        self._register_sunset(
-            self.hass,
-            self.async_update,
-            offset=timedelta(minutes=-self._candle_offset),
-        )
-
-        self._register_sunset(
-            self.hass,
-            self.async_update,
-            offset=timedelta(minutes=self._havdalah_offset),
-        )
-
-        # NEW: keep in lockstep on the minute
+        # The minute tick is the only trigger: candle-lighting and havdalah
+        # are rounded to the minute, so the :00 tick lands on both edges, and
+        # ticks before the next edge return early (see self._valid).
         self._register_listener(
             async_track_time_change(
                 self.hass,
@@ -729,40 +796,52 @@ class ShabbosMevorchimSensor(YidCalDevice, BinarySensorEntity):
             if not self._geo:
                 return
 
-            now_local = (now or dt_util.now()).astimezone(self._tz)
+            now_local = now.astimezone(self._tz) if now else dt_util.now(self._tz)
+            if self._valid is not None and self._valid[0] <= now_local < self._valid[1]:
+                return
+
             today = now_local.date()
             wd = today.weekday()  # 0=Mon … 4=Fri, 5=Sat
+            day_end = datetime.combine(today + timedelta(days=1), time(0), tzinfo=self._tz)
 
-            if wd == 4:
-                shabbos = today + timedelta(days=1)
-                friday = today
-                saturday = shabbos
-            elif wd == 5:
-                shabbos = today
-                friday = today - timedelta(days=1)
-                saturday = today
-            else:
+            if wd not in (4, 5):
                 self._attr_is_on = False
+                self._valid = (now_local, day_end)
                 return
-
-            if not self.helper.is_shabbos_mevorchim(shabbos):
+            saturday = today + timedelta(days=5 - wd)
+
+            if self._window is None or self._window[0] != saturday:
+                if self.helper.is_shabbos_mevorchim(saturday):
+                    on_time, off_time = _shabbos_window(
+                        self._geo, self._tz, today,
+                        self._candle_offset, self._havdalah_offset,
+                    )
+                    self._window = (saturday, on_time, off_time)
+                else:
+                    self._window = (saturday, None, None)
+
+            _, on_time, off_time = self._window
+            if on_time is None:
                 self._attr_is_on = False
+                self._valid = (now_local, day_end)
                 return
 
-            fri_sunset = sunset_for_date(geo=self._geo, tz=self._tz, base_date=friday)
-            sat_sunset = sunset_for_date(geo=self._geo, tz=self._tz, base_date=saturday)
-
-            raw_on  = fri_sunset - timedelta(minutes=self._candle_offset)
-            raw_off = sat_sunset + timedelta(minutes=self._havdalah_offset)
-
-            on_time  = _round_half_up(raw_on)
-            off_time = _round_ceil(raw_off)
-
             self._attr_is_on = (on_time <= now_local < off_time)
 
+            # Next possible flip: candle-lighting, havdalah, or the date roll
+            if now_local < on_time:
+                until = on_time
+            elif now_local < off_time:
+                until = off_time
+            else:
+                until = day_end
+            self._valid = (now_local, min(until, day_end))
+
         except Exception as e:
             _LOGGER.error("ShabbosMevorchim failed: %s", e)
             self._attr_is_on = False
+            self._valid = None
+            self._window = None
 
     @property
     def icon(self) -> str:
@@ -791,13 +870,8 @@ class UpcomingShabbosMevorchimSensor(YidCalDevice, BinarySensorEntity):
 
         await self.async_update()
 
-        # registered for cleanup — bare calls leaked these across reloads
-        self._register_interval(self.hass, self.async_update, timedelta(hours=1))
-
-        self._register_sunset(self.hass, self.async_update, offset=timedelta(minutes=-self._candle_offset))
-        self._register_sunset(self.hass, self.async_update, offset=timedelta(minutes=self._havdalah_offset))
-
-        # NEW: lockstep minute beat
+        # The minute tick is the only trigger: the rounded candle-lighting /
+        # havdalah edges always fall on a :00 tick.
         self._register_listener(
             async_track_time_change(
                 self.hass,
@@ -810,29 +884,21 @@ class UpcomingShabbosMevorchimSensor(YidCalDevice, BinarySensorEntity):
         if not self._geo:
             return
 
-        now_local = (now or dt_util.now()).astimezone(self._tz)
+        now_local = now.astimezone(self._tz) if now else dt_util.now(self._tz)
         today = now_local.date()
         wd = today.weekday()
 
         # If we're inside Shabbos window, force OFF
-        if wd in (4, 5):
-            friday = today if wd == 4 else (today - timedelta(days=1))
-            saturday = friday + timedelta(days=1)
-
-            fri_sunset = sunset_for_date(geo=self._geo, tz=self._tz, base_date=friday)
-            sat_sunset = sunset_for_date(geo=self._geo, tz=self._tz, base_date=saturday)
-
-            raw_on  = fri_sunset - timedelta(minutes=self._candle_offset)
-            raw_off = sat_sunset + timedelta(minutes=self._havdalah_offset)
-
-            shabbos_on  = _round_half_up(raw_on)
-            shabbos_off = _round_ceil(raw_off)
-
-            if shabbos_on <= now_local < shabbos_off:
-                self._attr_is_on = False
-                return
+        window = _shabbos_window(
+            self._geo, self._tz, today, self._candle_offset, self._havdalah_offset
+        )
+        if window is not None and window[0] <= now_local < window[1]:
+            self._attr_is_on = False
+            return
 
-        flag = self.helper.get_molad(today).is_upcoming_shabbos_mevorchim
+        # Only the flag is needed here -- ask for it directly instead of
+        # building a full MoladDetails (molad + Rosh Chodesh) for today.
+        flag = self.helper.is_upcoming_shabbos_mevorchim(today)
 
         # After candles Friday, must be OFF
         if wd == 4:
@@ -888,18 +954,6 @@ class RoshChodeshToday(YidCalDisplayDevice, SensorEntity):
             offset=timedelta(minutes=self._havdalah_offset),
         )
 
-        # Molad change can still force refresh
-        self._register_listener(
-            async_track_state_change_event(
-                self.hass,
-                ["sensor.yidcal_molad"],
-                self._handle_molad_change,
-            )
-        )
-
-    async def _handle_molad_change(self, event) -> None:
-        await self.async_update()
-
     def _tzeis(self, d: date) -> datetime:
         """Rounded tzeis = sunset(d) + offset, Motzi-style."""
         sunset = sunset_for_date(geo=self._geo, tz=self._tz, base_date=d)
@@ -909,14 +963,15 @@ class RoshChodeshToday(YidCalDisplayDevice, SensorEntity):
         if not self._geo:
             return
 
-        now_local = (now or dt_util.now()).astimezone(self._tz)
+        now_local = now.astimezone(self._tz) if now else dt_util.now(self._tz)
         today = now_local.date()
 
         # Match your Molad “base_date” rule near month start
-        hd_now = PHebrewDate.from_pydate(today)
+        hd_now = _hebrew_date(today)
         base_date = (today - timedelta(days=15)) if hd_now.day < 3 else today
 
         try:
+            # Memoized per Hebrew month; avoids the full get_molad on the loop
             rc = self.helper.get_rosh_chodesh_days(base_date)
             rc_gdays = list(rc.gdays or [])
         except Exception:
@@ -926,20 +981,23 @@ class RoshChodeshToday(YidCalDisplayDevice, SensorEntity):
             self._attr_native_value = "Not Rosh Chodesh Today"
             return
 
-        # Month name from the RC day itself (pyluach Hebrew month name)
-        month = PHebrewDate.from_pydate(rc_gdays[-1]).month_name(True)
-
         active_index: int | None = None
 
-        # Each RC "day" is: tzeis(prev day) -> tzeis(this day)
-        for i, gd in enumerate(rc_gdays):
-            start = self._tzeis(gd - timedelta(days=1))
-            end = self._tzeis(gd)
-            if start <= now_local < end:
+        # Each RC "day" is: tzeis(prev day) -> tzeis(this day). The days are
+        # consecutive, so the windows share edges: edges[i] .. edges[i + 1]
+        # is day i. Outside the civil span (one extra day for a tzeis that
+        # lands after midnight) no tzeis lookup is needed at all.
+        eve = rc_gdays[0] - timedelta(days=1)
+        if eve <= today <= rc_gdays[-1] + timedelta(days=1):
+            edges = [self._tzeis(eve)] + [self._tzeis(gd) for gd in rc_gdays]
+            i = bisect_right(edges, now_local) - 1
+            if 0 <= i < len(rc_gdays):
                 active_index = i
-                break
 
         if active_index is not None:
+            # Month name from the RC day itself (pyluach Hebrew month name)
+            hd_rc = _hebrew_date(rc_gdays[-1])
+            month = hebrew_month_name(hd_rc.year, hd_rc.month)
             if len(rc_gdays) == 1:
                 val = f"ראש חודש {month}"
             else:
@@ -7,7 +7,7 @@ from typing import Optional
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.event import (
-    async_track_time_interval,
+    async_track_time_change,
     async_track_sunset,
 )
 
@@ -16,6 +16,12 @@ from .yidcal_lib.sfirah_helper import SfirahHelper
 
 _LOGGER = logging.getLogger(__name__)
 
+# Hebrew combining marks (nikud and cantillation). Maqaf, paseq, sof pasuq
+# and nun hafukha sit in the same block but are not marks, so they are kept.
+_NIKUD_TABLE = dict.fromkeys(
+    (*range(0x0591, 0x05BE), 0x05BF, 0x05C1, 0x05C2, 0x05C4, 0x05C5, 0x05C7)
+)
+
 
 class BaseSefirahSensor(YidCalDisplayDevice, SensorEntity):
     """Base class for Sefirah (Omer) sensors."""
@@ -37,6 +43,9 @@ class BaseSefirahSensor(YidCalDisplayDevice, SensorEntity):
         self._havdalah_offset = havdalah_offset
 
         self._state: Optional[str] = None
+        # Helper text the current state was built from; the text only
+        # changes once a day at tzeis, so normalizing is skipped otherwise.
+        self._raw_text: Optional[str] = None
         self._attr_name = name
         self._attr_unique_id = unique_id
         self._attr_icon = "mdi:counter"
@@ -59,36 +68,38 @@ class BaseSefirahSensor(YidCalDisplayDevice, SensorEntity):
         # Immediate state
         await self.async_update()
 
-        # Minute tick – SAFE callback
-        @callback
-        def _on_minute(_now=None) -> None:   # <-- make optional (harmless)
-            self.async_schedule_update_ha_state(True)
-
-        unsub_min = async_track_time_interval(
-            self.hass, _on_minute, timedelta(minutes=1)
-        )
+        # Minute tick on :00 – the tzeis threshold is rounded up to the
+        # minute, so the sunset event alone can fire just before it.
+        unsub_min = async_track_time_change(self.hass, self._on_tick, second=0)
         self._register_listener(unsub_min)
 
-        # Update each day at tzeis = sunset + havdalah_offset – SAFE callback
-        @callback
-        def _on_tzeis(_now=None) -> None:    # <-- FIX: optional arg
-            self.async_schedule_update_ha_state(True)
-
+        # Update each day at tzeis = sunset + havdalah_offset
         unsub_tzeis = async_track_sunset(
             self.hass,
-            _on_tzeis,
+            self._on_tick,
             offset=timedelta(minutes=self._havdalah_offset),
         )
         self._register_listener(unsub_tzeis)
 
+    @callback
+    def _on_tick(self, _now=None) -> None:
+        """Minute / tzeis listener – SAFE callback (optional arg)."""
+        self.hass.async_create_task(self.async_update())
+
     async def async_update(self) -> None:
-        """Fetch new text from the helper and write state."""
+        """Fetch new text from the helper and write state if it changed."""
         try:
-            text = self._get_text()
+            raw = self._get_text()
+            if raw == self._raw_text:
+                # unchanged since the last write
+                return
+            text = raw
             if self._strip:
                 # Strip nikud (marks) while preserving normal letters
-                text = unicodedata.normalize("NFKC", text)
-                text = "".join(ch for ch in text if unicodedata.category(ch)[0] != "M")
+                if not unicodedata.is_normalized("NFKC", text):
+                    text = unicodedata.normalize("NFKC", text)
+                text = text.translate(_NIKUD_TABLE)
+            self._raw_text = raw
             self._state = text
         except Exception as e:
             _LOGGER.exception("Failed to compute Sefirah text: %s", e)
@@ -35,6 +35,7 @@ from .config_flow import DEFAULT_SLICHOS_LABEL_ROLLOVER
 from .zman_sensors import get_geo
 from .yidcal_lib.helper import int_to_hebrew  # existing util in YidCal
 from .yidcal_lib import halacha_events as he
+from .yidcal_lib.calcache import hebrew_date as _hebrew_date
 from .yidcal_lib.zman_compute import sunset_for_date  # shared cached zmanim
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,6 +51,9 @@ HEBREW_DAY_WORDS: dict[int, str] = {
     6: "ששי",  # never used here, but kept for completeness
 }
 
+# Elul Selichos ordinals (א׳, ב׳, …); the count never nears 40
+_ORDINAL_HEB: tuple[str, ...] = ("",) + tuple(int_to_hebrew(i) for i in range(1, 41))
+
 
 def _is_xiiimiddos(hd: PHebrewDate, weekday: int) -> bool:
     """Detect the special י"ג מידות day (Polin/Satmar custom).
@@ -66,6 +70,17 @@ def _is_xiiimiddos(hd: PHebrewDate, weekday: int) -> bool:
     )
 
 
+def _count_non_shabbos(start: datetime.date, end: datetime.date) -> int:
+    """Number of days in [*start*, *end*] that are not Shabbos (0 if empty)."""
+    days = (end - start).days + 1
+    if days <= 0:
+        return 0
+    weeks, rest = divmod(days, 7)
+    # each full week holds one Shabbos; the remainder holds one if it
+    # reaches the first Saturday on or after *start*
+    return days - weeks - ((5 - start.weekday()) % 7 < rest)
+
+
 async def async_setup_entry(hass, entry, async_add_entities):
     candle_offset = entry.options.get("candle_offset", 15)
     havdalah_offset = entry.options.get("havdalah_offset", 72)
@@ -90,11 +105,17 @@ class SlichosSensor(YidCalSpecialDevice, RestoreEntity, BinarySensorEntity):
         self.hass = hass
         self._candle_offset = candle_offset
         self._havdalah_offset = havdalah_offset
+        self._tz = ZoneInfo(hass.config.time_zone)
+        self._geo = None
         self._rollover = self.hass.data[DOMAIN]["config"].get(
             CONF_SLICHOS_LABEL_ROLLOVER, DEFAULT_SLICHOS_LABEL_ROLLOVER
         )
         self._attr_is_on: bool = False
         self._attr_extra_state_attributes: dict[str, str | bool | int] = {}
+        # (key, anchors) for the High-Holiday cycle; see _season_anchors
+        self._anchors: tuple[tuple, tuple] | None = None
+        # (key, edges) for the civil date; see _day_edges
+        self._edges: tuple[tuple, tuple] | None = None
 
     # ------------------------------------------------------------------ helpers
     def _schedule_update(self, *_args) -> None:
@@ -104,6 +125,89 @@ class SlichosSensor(YidCalSpecialDevice, RestoreEntity, BinarySensorEntity):
             lambda: self.hass.async_create_task(self.async_update())
         )
 
+    def _season_anchors(self, target_year: int, geo, tz) -> tuple:
+        """Dates and edges of the Selichos season for *target_year*.
+
+        These only move when the High-Holiday cycle (or the location) does,
+        so they are cached instead of being rebuilt on every minute tick.
+        """
+        key = (target_year, geo, tz)
+        if self._anchors is not None and self._anchors[0] == key:
+            return self._anchors[1]
+
+        # ------------------------------------------------ Alef‑Selichos calculation
+        tishrei1_greg = PHebrewDate(target_year, 7, 1).to_pydate()
+        rh_wd = tishrei1_greg.weekday()  # Mon=0 … Sun=6
+
+        pre_rh = tishrei1_greg - timedelta(days=1)
+        alef_shabbos = pre_rh - timedelta(days=((pre_rh.weekday() - 5) % 7))
+        if rh_wd in (0, 1):  # Monday or Tuesday R"H → start a week earlier
+            alef_shabbos -= timedelta(days=7)
+
+        alef_start = (
+            sunset_for_date(geo=geo, tz=tz, base_date=alef_shabbos)
+            + timedelta(minutes=self._havdalah_offset)
+        )
+
+        # ------------------------------------------------ Erev YK candle‑lighting
+        erev_yk_greg = PHebrewDate(target_year, 7, 9).to_pydate()
+        erev_yk_candle = (
+            sunset_for_date(geo=geo, tz=tz, base_date=erev_yk_greg)
+            - timedelta(minutes=self._candle_offset)
+        )
+
+        # ------------------------------------------------ Rosh HaShanah window
+        tishrei2_greg = tishrei1_greg + timedelta(days=1)
+        rh_start = (
+            sunset_for_date(geo=geo, tz=tz, base_date=pre_rh)
+            - timedelta(minutes=self._candle_offset)
+        )
+        rh_end = (
+            sunset_for_date(geo=geo, tz=tz, base_date=tishrei2_greg)
+            + timedelta(minutes=self._havdalah_offset)
+        )
+
+        anchors = (
+            tishrei1_greg,
+            alef_shabbos,
+            erev_yk_greg,
+            alef_start,
+            erev_yk_candle,
+            rh_start,
+            rh_end,
+        )
+        self._anchors = (key, anchors)
+        return anchors
+
+    def _day_edges(self, actual_date: datetime.date, geo, tz) -> tuple:
+        """Havdalah cut-off for *actual_date* and the edges of its week's Shabbos.
+
+        Cached per civil date so the minute tick does no sunset lookups.
+        """
+        key = (actual_date, geo, tz)
+        if self._edges is not None and self._edges[0] == key:
+            return self._edges[1]
+
+        havdalah_cut = (
+            sunset_for_date(geo=geo, tz=tz, base_date=actual_date)
+            + timedelta(minutes=self._havdalah_offset)
+        )
+
+        friday = actual_date - timedelta(days=(actual_date.weekday() - 4) % 7)
+        saturday = friday + timedelta(days=1)
+        shabbos_start = (
+            sunset_for_date(geo=geo, tz=tz, base_date=friday)
+            - timedelta(minutes=self._candle_offset)
+        )
+        shabbos_end = (
+            sunset_for_date(geo=geo, tz=tz, base_date=saturday)
+            + timedelta(minutes=self._havdalah_offset)
+        )
+
+        edges = (havdalah_cut, shabbos_start, shabbos_end)
+        self._edges = (key, edges)
+        return edges
+
     # ------------------------------------------------ lifecycle / listeners ----
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
@@ -112,10 +216,9 @@ class SlichosSensor(YidCalSpecialDevice, RestoreEntity, BinarySensorEntity):
             self._attr_is_on = (last.state or "").lower() == "on"
             self._attr_extra_state_attributes = dict(last.attributes or {})
 
-        # 1) Regular minute interval
-        self._register_interval(self.hass, self.async_update, timedelta(minutes=1))
+        self._geo = await get_geo(self.hass)
 
-        # 2) Top‑of‑minute cron (handles manual time jumps)
+        # Top‑of‑minute cron (also handles manual time jumps)
         unsub_cron = async_track_time_change(
             self.hass, self._schedule_update, second=0
         )
@@ -128,75 +231,48 @@ class SlichosSensor(YidCalSpecialDevice, RestoreEntity, BinarySensorEntity):
         if self.hass is None:
             return
 
-        tz = ZoneInfo(self.hass.config.time_zone)
+        tz = self._tz
         now = (now or datetime.datetime.now(tz)).astimezone(tz)
         actual_date = now.date()
 
-        geo = await get_geo(self.hass)
+        geo = self._geo
+        if geo is None:  # update_before_add runs ahead of async_added_to_hass
+            geo = self._geo = await get_geo(self.hass)
+
+        havdalah_cut_today, shabbos_start, shabbos_end = self._day_edges(
+            actual_date, geo, tz
+        )
 
         # -------------------------------------------------------------------
         # Determine festival date (after Havdalah roll‑over)
-        sunset_today = sunset_for_date(geo=geo, tz=tz, base_date=actual_date)
-        havdalah_cut_today = sunset_today + timedelta(minutes=self._havdalah_offset)
         festival_date = (
             actual_date + timedelta(days=1) if now >= havdalah_cut_today else actual_date
         )
-        hd_fest = PHebrewDate.from_pydate(festival_date)
+        hd_fest = _hebrew_date(festival_date)
 
         # ------------------------------------------------ select High‑Holiday cycle
         target_year = hd_fest.year if hd_fest.month >= 7 else hd_fest.year + 1
 
-        # ------------------------------------------------ Alef‑Selichos calculation
-        tishrei1_greg = PHebrewDate(target_year, 7, 1).to_pydate()
-        rh_wd = tishrei1_greg.weekday()  # Mon=0 … Sun=6
-
-        pre_rh = tishrei1_greg - timedelta(days=1)
-        alef_shabbos = pre_rh - timedelta(days=((pre_rh.weekday() - 5) % 7))
-        if rh_wd in (0, 1):  # Monday or Tuesday R"H → start a week earlier
-            alef_shabbos -= timedelta(days=7)
-
-        alef_start = (
-            sunset_for_date(geo=geo, tz=tz, base_date=alef_shabbos)
-            + timedelta(minutes=self._havdalah_offset)
-        )
-
-        # ------------------------------------------------ Erev YK candle‑lighting
-        erev_yk_greg = PHebrewDate(target_year, 7, 9).to_pydate()
-        erev_yk_candle = (
-            sunset_for_date(geo=geo, tz=tz, base_date=erev_yk_greg)
-            - timedelta(minutes=self._candle_offset)
-        )
+        (
+            tishrei1_greg,
+            alef_shabbos,
+            erev_yk_greg,
+            alef_start,
+            erev_yk_candle,
+            rh_start,
+            rh_end,
+        ) = self._season_anchors(target_year, geo, tz)
 
         in_global_window = alef_start <= now < erev_yk_candle
 
         # ------------------------------------------------ exclusions: Shabbos, R"H
-        wd_today = actual_date.weekday()
-        friday = actual_date - timedelta(days=(wd_today - 4) % 7)
-        saturday = friday + timedelta(days=1)
-
-        shabbos_start = (
-            sunset_for_date(geo=geo, tz=tz, base_date=friday)
-            - timedelta(minutes=self._candle_offset)
-        )
-        shabbos_end = (
-            sunset_for_date(geo=geo, tz=tz, base_date=saturday)
-            + timedelta(minutes=self._havdalah_offset)
-        )
         excluded_shabbos = shabbos_start <= now < shabbos_end
 
-        tishrei2_greg = tishrei1_greg + timedelta(days=1)
-        rh_start = (
-            sunset_for_date(geo=geo, tz=tz, base_date=tishrei1_greg - timedelta(days=1))
-            - timedelta(minutes=self._candle_offset)
-        )
-        rh_end = (
-            sunset_for_date(geo=geo, tz=tz, base_date=tishrei2_greg)
-            + timedelta(minutes=self._havdalah_offset)
-        )
         excluded_rosh_hashanah = rh_start <= now < rh_end
 
         # ------------------------------------------------ final ON/OFF state
         is_on = in_global_window and not (excluded_shabbos or excluded_rosh_hashanah)
+        was_on = self._attr_is_on
         self._attr_is_on = is_on
 
         # ====================================================================
@@ -207,61 +283,61 @@ class SlichosSensor(YidCalSpecialDevice, RestoreEntity, BinarySensorEntity):
             hd_today = hd_fest
         else:  # "midnight"
             today = actual_date             # civil date rolls 00:00
-            hd_today = PHebrewDate.from_pydate(today)
-        weekday = today.weekday()
-
-        # Anchor dates
-        erev_rh_greg = tishrei1_greg - timedelta(days=1)
-        # Canonical observed Tzom Gedaliah (3 Tishrei, pushed to Sunday
-        # 4 Tishrei when 3 Tishrei is Shabbos) — single source of truth.
-        tzom_gedaliah_greg = he.tzom_gedaliah_observed(target_year)
-
-        # ---- 13 Middos overrides everything else
-        if _is_xiiimiddos(hd_today, weekday):
-            label = "סליחות ליום חמישי מעשי\"ת"
-
-        # ---- Fixed captions
-        elif today == erev_rh_greg:
-            label = "סליחות לערב ר\"ה"
-        elif today == tzom_gedaliah_greg:
-            label = "סליחות לצום גדליה"
-        elif hd_today.month == 7 and hd_today.day == 9:  # 9 Tishrei – Erev YK
-            label = "סליחות לערב יוה\"כ"
-
-        # ---- Aseres-Yemei-Teshuvah numbering (after the fast, before Erev YK)
-        elif hd_today.month == 7 and tzom_gedaliah_greg < today < erev_yk_greg:
-            # Day-1 = Tzom Gedaliah itself (3 Tishrei)
-            cnt = 1
-            d = tzom_gedaliah_greg + timedelta(days=1)     # start with 4 Tishrei
-            # Skip incrementing on:
-            #   - Shabbos Shuvah (no slichos that day)
-            #   - The 13-middos override day, since the override has already
-            #     claimed the "חמישי" label. In a swap year (RH=Sat) the
-            #     override fires on day 4 (Thu 6T) rather than day 5; skipping
-            #     it here makes Fri 7T fall back to "רביעי" instead of
-            #     duplicating "חמישי". In normal years (RH=Mon/Tue/Thu) the
-            #     override is on day 5 = the last AYT day, so this skip is a
-            #     no-op there.
-            while d <= today:
-                hd_d = PHebrewDate.from_pydate(d)
-                if d.weekday() != 5 and not _is_xiiimiddos(hd_d, d.weekday()):
-                    cnt += 1
-                d += timedelta(days=1)
-
-            # cnt now 1…6 → ראשון…חמישי
-            label = f"סליחות ליום {HEBREW_DAY_WORDS[cnt]} מעשי\"ת"
-
-        # ---- Elul period ordinal
-        elif is_on:  # still active but none of the above captions applied
-            first_morning = alef_shabbos + timedelta(days=1)
-            ordinal = 0
-            d = first_morning
-            while d <= today:
-                if d.weekday() != 5:  # skip Shabbos mornings
-                    ordinal += 1
-                d += timedelta(days=1)
-            if ordinal:
-                label = f"סליחות ליום {int_to_hebrew(ordinal)}"
+            hd_today = _hebrew_date(today)
+
+        # Every caption falls in Elul or Tishrei; the rest of the year the
+        # label is empty and the anchors below are not needed.
+        if hd_today.month in (6, 7):
+            weekday = today.weekday()
+
+            # Anchor dates
+            erev_rh_greg = tishrei1_greg - timedelta(days=1)
+            # Canonical observed Tzom Gedaliah (3 Tishrei, pushed to Sunday
+            # 4 Tishrei when 3 Tishrei is Shabbos) — single source of truth.
+            tzom_gedaliah_greg = he.tzom_gedaliah_observed(target_year)
+
+            # ---- 13 Middos overrides everything else
+            if _is_xiiimiddos(hd_today, weekday):
+                label = "סליחות ליום חמישי מעשי\"ת"
+
+            # ---- Fixed captions
+            elif today == erev_rh_greg:
+                label = "סליחות לערב ר\"ה"
+            elif today == tzom_gedaliah_greg:
+                label = "סליחות לצום גדליה"
+            elif hd_today.month == 7 and hd_today.day == 9:  # 9 Tishrei – Erev YK
+                label = "סליחות לערב יוה\"כ"
+
+            # ---- Aseres-Yemei-Teshuvah numbering (after the fast, before Erev YK)
+            elif hd_today.month == 7 and tzom_gedaliah_greg < today < erev_yk_greg:
+                # Day-1 = Tzom Gedaliah itself (3 Tishrei)
+                first = tzom_gedaliah_greg + timedelta(days=1)  # start with 4 Tishrei
+                # Skip incrementing on:
+                #   - Shabbos Shuvah (no slichos that day)
+                #   - The 13-middos override day, since the override has already
+                #     claimed the "חמישי" label. In a swap year (RH=Sat) the
+                #     override fires on day 4 (Thu 6T) rather than day 5; skipping
+                #     it here makes Fri 7T fall back to "רביעי" instead of
+                #     duplicating "חמישי". In normal years (RH=Mon/Tue/Thu) the
+                #     override is on day 5 = the last AYT day, so this skip is a
+                #     no-op there.
+                cnt = 1 + _count_non_shabbos(first, today)
+                for day in (6, 8):  # the only candidates for the override
+                    d = tishrei1_greg + timedelta(days=day - 1)
+                    if first <= d <= today and _is_xiiimiddos(
+                        PHebrewDate(hd_today.year, 7, day), d.weekday()
+                    ):
+                        cnt -= 1
+
+                # cnt now 1…6 → ראשון…חמישי
+                label = f"סליחות ליום {HEBREW_DAY_WORDS[cnt]} מעשי\"ת"
+
+            # ---- Elul period ordinal
+            elif is_on:  # still active but none of the above captions applied
+                # skip Shabbos mornings
+                ordinal = _count_non_shabbos(alef_shabbos + timedelta(days=1), today)
+                if ordinal:
+                    label = f"סליחות ליום {_ORDINAL_HEB[ordinal]}"
 
         # ====================================================================
         # Expose attributes
@@ -275,6 +351,13 @@ class SlichosSensor(YidCalSpecialDevice, RestoreEntity, BinarySensorEntity):
             "Selichos_Label": label or "",
         }
 
+        prev = self._attr_extra_state_attributes
         self._attr_extra_state_attributes = attrs
+        # Only push when something besides "Now" moved; the platform poll
+        # still refreshes "Now" on its own cadence.
+        if is_on == was_on and all(
+            prev.get(k) == v for k, v in attrs.items() if k != "Now"
+        ):
+            return
         # ensure HA sees the new state/attrs
         self.async_write_ha_state()
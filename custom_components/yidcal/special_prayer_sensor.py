@@ -121,6 +121,9 @@ from .yidcal_lib.halacha_events import is_no_melacha, vayehi_noam_omitted
 HOLIDAY_SENSOR = "sensor.yidcal_holiday"
 NO_MELOCHA_SENSOR = "binary_sensor.yidcal_no_melucha"
 
+# Months that are entirely מוריד הגשם (Tishrei and Nissan are partial)
+GESHEM_MONTHS = frozenset({"חשון", "כסלו", "טבת", "שבט", "אדר", "אדר א", "אדר ב"})
+
 
 # Hoshanos sequences depend on the weekday of 15 Tishrei (first day of Sukkos, chutz la'aretz).
 # Keys are Python weekday() where Monday=0 ... Sunday=6.
@@ -400,7 +403,7 @@ class SpecialPrayerSensor(YidCalDisplayDevice, SensorEntity):
             # ---------- מוריד הגשם / מוריד הטל ----------
             is_morid_geshem = (
                 (m_he == "תשרי" and (day > 22 or (day == 22 and now >= dawn)))
-                or m_he in ["חשון", "כסלו", "טבת", "שבט", "אדר", "אדר א", "אדר ב"]
+                or m_he in GESHEM_MONTHS
                 or (m_he == "ניסן" and (day < 15 or (day == 15 and now < dawn)))
             )
             is_morid_tal = not is_morid_geshem
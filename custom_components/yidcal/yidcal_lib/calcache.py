@@ -6,6 +6,9 @@ Sensors that scan hundreds of days per update (three-day-yomtov,
 no-melucha lookahead, upcoming sensors) pay that cost thousands of times a
 minute. The answers are pure functions of (civil date, diaspora), so a
 bounded LRU cache is always safe.
+
+The same holds for the Gregorian → Hebrew conversion the molad / Rosh
+Chodesh code repeats for the same few dates on every minute tick.
 """
 from __future__ import annotations
 
@@ -13,9 +16,16 @@ import datetime
 from functools import lru_cache
 
 from hdate import HDateInfo
+from pyluach.hebrewcal import HebrewDate as PHebrewDate
 
 
 @lru_cache(maxsize=16384)
 def is_yom_tov(d: datetime.date, diaspora: bool) -> bool:
     """Cached ``HDateInfo(d, diaspora=...).is_yom_tov``."""
     return HDateInfo(d, diaspora=diaspora).is_yom_tov
+
+
+@lru_cache(maxsize=1024)
+def hebrew_date(d: datetime.date) -> PHebrewDate:
+    """Cached ``PHebrewDate.from_pydate(d)``. Callers must not mutate the result."""
+    return PHebrewDate.from_pydate(d)
@@ -11,7 +11,9 @@ import logging
 import datetime
 from datetime import datetime, timezone, timedelta, date
 from zoneinfo import ZoneInfo
-from pyluach.hebrewcal import HebrewDate as PHebrewDate, Month as PMonth, Year as PYear
+from pyluach.hebrewcal import HebrewDate as PHebrewDate, Month as PMonth
+
+from .calcache import hebrew_date as _hebrew_date
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +33,35 @@ def is_shabbat(gdate: datetime.date) -> bool:
     return gdate.weekday() == 5  # Python: Monday=0 … Saturday=5
 
 
+def months_in_year(year: int) -> int:
+    """Number of months in Hebrew ``year``: 13 in a leap year (pyluach
+    month 13 = Adar II), else 12. Lets callers branch on the month count
+    instead of probing ``PMonth(year, month + 1)`` for a ValueError.
+
+    Leap years are years 3, 6, 8, 11, 14, 17 and 19 of the 19-year cycle,
+    i.e. ``(7 * year + 1) % 19 < 7`` -- the same rule pyluach's
+    ``Year.leap`` applies.
+    """
+    return 13 if (7 * year + 1) % 19 < 7 else 12
+
+
+# pyluach's ``month_name(hebrew=True)`` strings, indexed by pyluach month
+# number - 1 (1=Nissan … 12=Adar / Adar I, 13=Adar II).
+_HEB_MONTHS = (
+    "ניסן", "אייר", "סיון", "תמוז", "אב", "אלול",
+    "תשרי", "חשון", "כסלו", "טבת", "שבט", "אדר",
+)
+_HEB_MONTHS_LEAP = _HEB_MONTHS[:11] + ("אדר א׳", "אדר ב׳")
+
+
+def hebrew_month_name(year: int, month: int) -> str:
+    """Hebrew name of pyluach ``month`` in ``year`` — same string as
+    ``PHebrewDate(year, month, 1).month_name(True)`` without building a date.
+    """
+    table = _HEB_MONTHS_LEAP if months_in_year(year) == 13 else _HEB_MONTHS
+    return table[month - 1]
+
+
 class Molad:
     def __init__(self, day: str, hours: int, minutes: int, am_or_pm: str, chalakim: int, friendly: str, date: date, dt: datetime):
         self.day = day
@@ -70,13 +101,19 @@ class YidCalHelper:
         self.config = config
         self.tz = ZoneInfo(self.config.time_zone)
         # config may contain offsets or location data if needed elsewhere
+        # get_molad() memo: date -> MoladDetails (see get_molad)
+        self._molad_cache: dict[date, MoladDetails] = {}
+        # get_rosh_chodesh_days() memo: (hebrew year, month) -> RoshChodesh
+        self._rc_cache: dict[tuple[int, int], RoshChodesh] = {}
+        # is_shabbos_mevorchim() memo: Saturday -> bool
+        self._mevorchim_cache: dict[date, bool] = {}
 
     def get_numeric_month_year(self, gdate: datetime.date) -> dict[str, int]:
         """
         Given a Python date, return the Hebrew year/month via pyluach.
         Example: gdate = 2025-07-26 → {"year": 5785, "month": 5} (Av).
         """
-        hd = PHebrewDate.from_pydate(gdate)
+        hd = _hebrew_date(gdate)
         return {"year": hd.year, "month": hd.month}
 
     def get_next_numeric_month_year(self, gdate: datetime.date) -> dict[str, int]:
@@ -84,19 +121,17 @@ class YidCalHelper:
         Given a Python date, return the numeric Hebrew year/month of the next Hebrew month.
         Rolls over into the next Hebrew year when needed.
         """
-        hd = PHebrewDate.from_pydate(gdate)
+        hd = _hebrew_date(gdate)
         hy, hm = hd.year, hd.month
         nm = hm + 1
 
         if hm == 6:            # Elul → Tishrei
             return {"year": hy + 1, "month": 7}
 
-        try:
-            PMonth(hy, nm)     # valid within the same Hebrew year?
-            return {"year": hy, "month": nm}
-        except ValueError:
+        if nm > months_in_year(hy):
             # overflow (e.g., Adar → Nissan): same pyluach year
             return {"year": hy, "month": 1}
+        return {"year": hy, "month": nm}
 
     def get_gdate(self, numeric_date: dict[str, int], day: int) -> datetime.date:
         """
@@ -124,20 +159,31 @@ class YidCalHelper:
         truth, proven equal to the previous inline computation across
         5779-5812); this method just wraps them in the RoshChodesh
         display object (weekday names, "Shabbos & Sunday" text).
+
+        Memoized per Hebrew month: every date in a month maps to the same
+        result, and get_molad / is_shabbos_mevorchim ask for it on each new
+        day. Callers treat the returned object as read-only.
         """
+        hd = _hebrew_date(today)
+        key = (hd.year, hd.month)
+        rc = self._rc_cache.get(key)
+        if rc is None:
+            rc = self._rosh_chodesh_following(*key)
+            if len(self._rc_cache) >= 16:
+                self._rc_cache.clear()
+            self._rc_cache[key] = rc
+        return rc
+
+    def _rosh_chodesh_following(self, hy: int, hm: int) -> RoshChodesh:
+        """Uncached body of get_rosh_chodesh_days for Hebrew month (hy, hm)."""
         from . import halacha_events as he
 
-        hd = PHebrewDate.from_pydate(today)
-        hy, hm = hd.year, hd.month
-
         # --- next month (handle Elul→Tishrei year rollover) ---
         if hm == 6:               # Elul → Tishrei bumps the Hebrew year
             hy_next, nm = hy + 1, 7
         else:
             hy_next, nm = hy, hm + 1
-            try:
-                PMonth(hy_next, nm)
-            except ValueError:
+            if nm > months_in_year(hy):
                 hy_next, nm = hy, 1   # Adar → Nissan: same pyluach year
 
         hd1_next = PHebrewDate(hy_next, nm, 1)
@@ -173,7 +219,7 @@ class YidCalHelper:
         sat_date = rc_date - timedelta(days=days_back)
 
         # Convert that Saturday → pyluach Hebrew-day
-        hd_sat = PHebrewDate.from_pydate(sat_date)
+        hd_sat = _hebrew_date(sat_date)
         return hd_sat.day
 
     def is_shabbos_mevorchim(self, today: datetime.date) -> bool:
@@ -185,18 +231,31 @@ class YidCalHelper:
         truth shared with the luach) — proven equal to the previous
         inline special-case logic across 5779-5812. Rosh Chodesh Tishrei
         is always skipped.
+
+        Memoized per Saturday: the Mevorchim sensors and
+        is_upcoming_shabbos_mevorchim ask about the same Shabbos on every
+        tick of the week.
         """
         from . import halacha_events as he
 
         if not is_shabbat(today):
             return False
 
+        cached = self._mevorchim_cache.get(today)
+        if cached is not None:
+            return cached
+
         rc = self.get_rosh_chodesh_days(today)
         if rc.month.upper() == "TISHREI" or not rc.gdays:
-            return False
+            result = False
+        else:
+            nxt = _hebrew_date(rc.gdays[-1])
+            result = today == he.mevorchim_shabbos_for_month(nxt.year, nxt.month)
 
-        nxt = PHebrewDate.from_pydate(rc.gdays[-1])
-        return today == he.mevorchim_shabbos_for_month(nxt.year, nxt.month)
+        if len(self._mevorchim_cache) >= 16:
+            self._mevorchim_cache.clear()
+        self._mevorchim_cache[today] = result
+        return result
 
         
     def is_upcoming_shabbos_mevorchim(self, today: datetime.date) -> bool:
@@ -223,7 +282,7 @@ class YidCalHelper:
         built-in molad_announcement().
         """
         # 1) Pick the target year/month
-        hd = PHebrewDate.from_pydate(today)
+        hd = _hebrew_date(today)
         hy, hm = hd.year, hd.month
 
         if hd.day < 3:
@@ -231,7 +290,7 @@ class YidCalHelper:
             pass
         else:
             # Molad for the *next* Hebrew month
-            is_leap = PYear(hy).leap
+            is_leap = months_in_year(hy) == 13
             # Elul (6) -> Tishrei (7) bumps the *year*
             if hm == 6:
                 hy += 1
@@ -300,12 +359,22 @@ class YidCalHelper:
     def get_molad(self, today: datetime.date) -> MoladDetails:
         """
         Package up your Molad + Mevorchim + RoshChodesh into one object.
+
+        Memoized per date: the result is a pure function of ``today`` (and
+        self.tz). MoladSensor is the only caller; it runs this in the
+        executor once per new day.
         """
-        m    = self.get_actual_molad(today)
-        ism  = self.is_shabbos_mevorchim(today)
-        isu  = self.is_upcoming_shabbos_mevorchim(today)
-        rc   = self.get_rosh_chodesh_days(today)
-        return MoladDetails(m, ism, isu, rc)
+        details = self._molad_cache.get(today)
+        if details is None:
+            m    = self.get_actual_molad(today)
+            ism  = self.is_shabbos_mevorchim(today)
+            isu  = self.is_upcoming_shabbos_mevorchim(today)
+            rc   = self.get_rosh_chodesh_days(today)
+            details = MoladDetails(m, ism, isu, rc)
+            if len(self._molad_cache) >= 16:
+                self._molad_cache.clear()
+            self._molad_cache[today] = details
+        return details
 
 def int_to_hebrew(num: int) -> str:
     """
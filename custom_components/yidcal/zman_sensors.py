@@ -20,7 +20,7 @@ from pyluach.hebrewcal import HebrewDate as PHebrewDate
 
 from zmanim.util.geo_location import GeoLocation
 
-from .const import DOMAIN
+from .const import DOMAIN, GEO_KEY
 from .device import YidCalZmanDevice
 from .yidcal_lib.zman_compute import (
     dawn_for_date,
@@ -103,11 +103,15 @@ def _no_melacha_block(
 
 # ─── Geo helpers ────────────────────────────────────────────────────────────
 
-def _create_geo(hass: HomeAssistant) -> GeoLocation:
+def _geo_params(hass: HomeAssistant) -> tuple[float, float, str]:
     cfg = (hass.data.get(DOMAIN, {}) or {}).get("config", {}) or {}
     lat = cfg.get("latitude",  hass.config.latitude)
     lon = cfg.get("longitude", hass.config.longitude)
     tz  = cfg.get("tzname",    hass.config.time_zone)
+    return lat, lon, tz
+
+def _create_geo(hass: HomeAssistant) -> GeoLocation:
+    lat, lon, tz = _geo_params(hass)
     return GeoLocation(
         name="YidCal",
         latitude=lat,
@@ -117,8 +121,18 @@ def _create_geo(hass: HomeAssistant) -> GeoLocation:
     )
 
 async def get_geo(hass: HomeAssistant) -> GeoLocation:
-    # Build from shared config with safe fallbacks to HA’s core config
-    return await hass.async_add_executor_job(_create_geo, hass)
+    # Build from shared config with safe fallbacks to HA’s core config.
+    # Every entity asks for this in async_added_to_hass; building it loads
+    # the tz file (hence the executor), so build once per location and hand
+    # the same read-only GeoLocation to all of them.
+    data = hass.data.setdefault(DOMAIN, {})
+    key = _geo_params(hass)
+    cached = data.get(GEO_KEY)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    geo = await hass.async_add_executor_job(_create_geo, hass)
+    data[GEO_KEY] = (key, geo)
+    return geo
 
 # ─── Lighting helpers for multi-day schedules ───────────────────────────────
 